@@ -1,10 +1,98 @@
-from .utils import _SuppressPrints, _df_input_conditions
+from .utils import _df_input_conditions, _standardize
 import numpy as np
 import pandas as pd
+from scipy.linalg import cho_factor, cho_solve
+from scipy.special import expit
 import statsmodels.api as sm
+from statsmodels.base.model import LikelihoodModelResults
+from statsmodels.discrete.discrete_model import (BinaryResultsWrapper,
+                                                 LogitResults)
 
 __all__ = ['Logit']
 
+# Variance of the standard logistic distribution (error term of the latent
+# variable), used for fully standardized coefficients
+_LOGISTIC_VARIANCE = np.pi ** 2 / 3
+
+
+def _logit_irls_step(X, y, params, eta, p, w):
+    """Take one IRLS (Newton) step for the logit model.
+
+    The working arrays eta, p and w (each with shape (# observations, ))
+    are preallocated by the caller and overwritten in place, so that the
+    sigmoid and weights do not allocate temporaries on every iteration.
+
+    X'WX is symmetric positive definite, so the update is solved via its
+    Cholesky factor, which is also returned for re-use by the caller.
+
+    Returns:
+        tuple: the update to params and the Cholesky factorization of X'WX
+        (in the form returned by scipy.linalg.cho_factor), both evaluated
+        at params.
+    """
+    np.dot(X, params, out=eta)
+    expit(eta, out=p)  # p = 1 / (1 + exp(-eta)), stable for large |eta|
+    # w = p * (1 - p)
+    np.subtract(1, p, out=w)
+    w *= p
+    XtWX_cho = cho_factor((X.T * w) @ X)
+    # Score X'(y - p), re-using eta for the residuals
+    np.subtract(y, p, out=eta)
+    delta = cho_solve(XtWX_cho, X.T @ eta)
+    return delta, XtWX_cho
+
+
+def _fit_logit_irls(model, *, tol=1e-8, maxiter=35):
+    """Fit a Statsmodels Logit model via iteratively reweighted least
+    squares (IRLS), bypassing the generic Statsmodels optimizer.
+
+    Each iteration solves the weighted normal equations
+    (X'WX) delta = X'(y - p), where p are the fitted probabilities and
+    W = diag(p * (1 - p)).  This is the IRLS update written in Newton form,
+    which avoids dividing by the weights when p is close to 0 or 1.
+
+    Args:
+        model (sm.Logit): the Statsmodels model (with constant in exog).
+        tol (float, optional): Defaults to 1e-8.  Convergence is reached when
+            the largest absolute change in a coefficient is below tol.
+        maxiter (int, optional): Defaults to 35 (same as Statsmodels).
+
+    Returns:
+        Statsmodels BinaryResultsWrapper (LogitResults) equivalent to
+        model.fit(), or None if the iterations do not converge or
+        X'WX is not positive definite.  The caller should then fall back
+        to the Statsmodels optimizer.  The mle_retvals of the results
+        have the same keys as for the Statsmodels Newton optimizer
+        (fopt, score & Hessian are scaled by 1 / # observations).
+    """
+    X, y = model.exog, model.endog
+    params = np.zeros(X.shape[1])
+    eta, p, w = np.empty(len(y)), np.empty(len(y)), np.empty(len(y))
+    try:
+        for iteration in range(1, maxiter + 1):
+            delta, XtWX_cho = _logit_irls_step(X, y, params, eta, p, w)
+            params += delta
+            if np.max(np.abs(delta)) < tol:
+                break
+        else:
+            return None
+        # At convergence the last factor of X'WX gives the covariance matrix
+        cov_params = cho_solve(XtWX_cho, np.eye(len(params)))
+    except np.linalg.LinAlgError:
+        return None
+
+    mlefit = LikelihoodModelResults(model, params, cov_params, scale=1.)
+    nobs = len(y)
+    mlefit.mle_retvals = {'fopt': -model.loglike(params) / nobs,
+                          'iterations': iteration,
+                          'score': model.score(params) / nobs,
+                          'Hessian': model.hessian(params) / nobs,
+                          'warnflag': 0,
+                          'converged': True}
+    mlefit.mle_settings = {'optimizer': 'irls', 'tol': tol,
+                           'maxiter': maxiter}
+    return BinaryResultsWrapper(LogitResults(model, mlefit))
+
 
 class Logit:
     """Logistic regression model.
@@ -14,8 +102,9 @@ class Logit:
             columns)
         - Fit model:
             - Run model and store estimates as model object attributes
-            - Run model on standardized X and y and store estimates in
-                attributes.
+            - Derive standardized estimates from the fitted model and
+                store them in attributes (done when they are first
+                accessed).
 
     Args:
         df (pd.DataFrame): Pandas DataFrame that contains the data to use
@@ -114,6 +203,8 @@ class Logit:
     def X_standardized(self):
         """pd.DataFrame: exogenous variables standardized (only the values
         used in the model)"""
+        if self._std_results is None:
+            self._standardize_results()
         return self._X_standardized
 
     @property
@@ -146,7 +237,11 @@ class Logit:
 
         If the model was not fitted before an attempt to access the attribute,
         then the model will be fitted and the results are returned.
+
+        The summary is only built on first access (and then stored).
         """
+        if self._results_output is None:
+            self._results_output = self._results.summary(alpha=self._alpha)
         return self._results_output
 
     @property
@@ -178,6 +273,10 @@ class Logit:
         is needed.
         Other attributes can also be accessed for exporting the data.
         """
+        if self._results_output_standardized is None:
+            if self._std_results is None:
+                self._standardize_results()
+            self._results_output_standardized = self._style_std_results()
         return self._results_output_standardized
 
     @property
@@ -228,13 +327,21 @@ class Logit:
         """
         _df_input_conditions(self._X, self._y)
 
-        model = sm.Logit(self._y, sm.add_constant(self._X))
+        # Design matrix is built once: IRLS and the results share model.exog
+        # ('add' so that 'const' is always the first column)
+        model = sm.Logit(self._y, sm.add_constant(self._X,
+                                                  has_constant='add'))
+        # Float array of the regressors for internal calculations
+        # (a view on the design matrix, without the constant)
+        self._X_values = model.exog[:, 1:]
 
         if printing:
             print("Model fitting in progress...")
-        with _SuppressPrints():  # hide Statsmodels printing
-            self._results = model.fit()
-        self._results_output = self._results.summary(alpha=self._alpha)
+        self._results = _fit_logit_irls(model)
+        if self._results is None:
+            # IRLS did not converge - use the Statsmodels optimizer instead
+            self._results = model.fit(disp=0)  # hide Statsmodels printing
+        self._results_output = None  # summary is made on first access
 
         model_selection_dict = {"log_likelihood": self._results.llf,
                                 "r_squared_pseudo": self._results.prsquared,
@@ -242,11 +349,20 @@ class Logit:
                                 "bic": self._results.bic}
         self._model_selection_stats = model_selection_dict
         self._log_likelihood = self._results.llf
-        self._odds_ratios = pd.Series(np.exp(self._results.params
-                                             .drop('const')),
+        # Sample range of each regressor (used for predictions)
+        self._X_min = self._X_values.min(axis=0)
+        self._X_max = self._X_values.max(axis=0)
+        # Constant is the first param (sm.add_constant prepends it)
+        params = self._results.params
+        self._params = params.to_numpy()  # used for predictions
+        self._odds_ratios = pd.Series(np.exp(params.to_numpy()[1:]),
+                                      index=params.index[1:],
                                       name='odds_ratios')
 
-        self._standardize_results()
+        # Standardized estimates are only derived on first access of
+        # X_standardized or results_output_standardized
+        self._std_results = None
+        self._results_output_standardized = None
 
         self._is_fitted = True
         if printing:
@@ -259,51 +375,50 @@ class Logit:
 
         Pipeline:
         - Drop any rows with NaNs (done in regress function)
-        - Standardization of X and y
-        - Fit model on standardized X and y
+        - Standardization of X
+        - Derive the x-standardized estimates from the raw estimates
         - Gather relevant estimates in a Pandas DataFrame & set to attribute
+
+        The logit coefficients of a standardized regressor are its raw
+        coefficients scaled by the standard deviation of the regressor,
+        so the model does not need to be fitted again on standardized X.
         """
-        # Standardization accounts for NaN values (via Pandas)
-        stdev_X = self._X.std(ddof=1)
-        self._X_standardized = (
-            self._X - self._X.mean()) / stdev_X
-
-        # Model fitting
-        model_standardized = sm.Logit(self._y,
-                                      sm.add_constant(self._X_standardized))
-        results_obj = model_standardized.fit(disp=0)  # hide second output info
-
-        # Initialize dataframe (regressors in index only)
-        output_indices = results_obj.params.drop('const').index
-        output_cols = ['coef', 't', 'P>|t|',
-                       'coef_stdX', 'coef_stdXy', 'stdev_X']
-        std_results_output = pd.DataFrame(index=output_indices,
-                                          columns=output_cols)
-        std_results_output = std_results_output.rename_axis(self._y.name)
-
-        # Gather values from model that took the raw data
-        std_results_output['coef'] = self._results.params
-        std_results_output['t'] = self._results.tvalues  # col 1
-        std_results_output['P>|t|'] = self._results.pvalues  # col 2
-        if not results_obj.use_t:
-            # Output will be labelled as z-scores, not t-values
-            std_results_output.rename(columns={'t': 'z', 'P>|t|': 'P>|z|'},
-                                      inplace=True)
-        test_dist_name = std_results_output.columns[1]  # store for dict later
-        p_col_name = std_results_output.columns[2]  # store for dict later
-        # Gather values from the model that took the standardized data
-        std_results_output['coef_stdX'] = results_obj.params
-        std_results_output['stdev_X'] = stdev_X
+        # Standardization (single pass for the means, ddof=1)
+        X_standardized, stdev_X = _standardize(self._X_values)
+        self._X_standardized = pd.DataFrame(X_standardized,
+                                            index=self._X.index,
+                                            columns=self._X.columns)
+
+        # Estimates from the raw model (constant is the first param)
+        coef = self._results.params.to_numpy()[1:]
+        coef_stdX = coef * stdev_X  # x-standardized estimates
 
         # Now calculate std_XY (via Long's method):
-        var_explained = self._results.fittedvalues.std() ** 2
-        var_ystar = var_explained + np.pi ** 2 / 3  # ystar is latent variable
-        std_results_output['coef_stdXy'] = ((std_results_output['coef'] *
-                                             stdev_X)
-                                            / np.sqrt(var_ystar))
-
-        # Make Pandas Styler object
-        std_results_output = std_results_output\
+        var_explained = self._results.fittedvalues.to_numpy().var(ddof=1)
+        var_ystar = var_explained + _LOGISTIC_VARIANCE  # ystar is latent
+        coef_stdXy = coef_stdX / np.sqrt(var_ystar)
+
+        # Output will be labelled as z-scores if use_t is False
+        test_dist_name, p_col_name = (('t', 'P>|t|') if self._results.use_t
+                                      else ('z', 'P>|z|'))
+        # Make dataframe in one go (regressors in index)
+        std_results_output = pd.DataFrame(
+            {'coef': coef,
+             test_dist_name: self._results.tvalues.to_numpy()[1:],
+             p_col_name: self._results.pvalues.to_numpy()[1:],
+             'coef_stdX': coef_stdX,
+             'coef_stdXy': coef_stdXy,
+             'stdev_X': stdev_X},
+            index=self._results.params.index[1:]).rename_axis(self._y.name)
+
+        self._std_results = std_results_output
+
+    def _style_std_results(self):
+        """Make the Pandas Styler object for results_output_standardized
+        from the dataframe of standardized estimates."""
+        test_dist_name = self._std_results.columns[1]  # t or z
+        p_col_name = self._std_results.columns[2]  # P>|t| or P>|z|
+        std_results_output = self._std_results\
             .style.format({'coef': "{:+.4f}",
                            test_dist_name: '{:+.3f}',
                            p_col_name: '{:.3f}',
@@ -312,8 +427,7 @@ class Logit:
                            'stdev_X': '{:.4f}'})
         std_results_output.set_caption(
             "Unstandardized and Standardized Estimates")
-        self._results_output_standardized = std_results_output
-        pass
+        return std_results_output
 
     def predict(self, X_predict, *, within_sample=True):
         """Predict the value(s) of given example(s) based on the fitted model.
@@ -360,24 +474,23 @@ class Logit:
             # If there is a NaN, then the Numpy comparison still leads
             # to a NaN prediction
             # Truth array `vals_in_range` shape (# examples, # regressors)
-            vals_in_range_min = np.less_equal(np.tile(self._X.min().T,
-                                                      (examples_to_predict, 1)),
-                                              X_predict)
-            vals_in_range_max = np.greater_equal(X_predict,
-                                                 np.tile(self._X.min().T,
-                                                         (examples_to_predict, 1)))
-            vals_in_range = vals_in_range_min & vals_in_range_max
+            # (sample min & max arrays are broadcast across the examples,
+            # and the max check is ANDed into the min check in place)
+            vals_in_range = np.greater_equal(X_predict, self._X_min)
+            np.logical_and(vals_in_range, X_predict <= self._X_max,
+                           out=vals_in_range)
             # Truth array - shape (# examples, )
             # for whether each observation has all X vals in range
-            all_vals_in_range = vals_in_range.all(axis=1)
+            all_vals_in_range = np.all(vals_in_range, axis=-1)
 
-            # Add constant into prediction
-            # Make X_predict have shape (# examples, # regressors + 1)
-            X_predict = np.concatenate([np.ones((examples_to_predict, 1)),
-                                        X_predict], axis=1)
+        # Add constant into prediction (one allocation)
+        # Design matrix has shape (# examples, # regressors + 1)
+        X_design = np.empty((examples_to_predict, regressors_count + 1))
+        X_design[:, 0] = 1
+        X_design[:, 1:] = X_predict
 
-        # Statsmodels predict takes arg w/ shape (# examples, # regressors + 1)
-        preds = self._results.predict(exog=X_predict)
+        # Logistic function of the linear predictor
+        preds = expit(X_design @ self._params)
         if within_sample:
             preds = np.where(all_vals_in_range, preds, np.NaN)
         return preds
@@ -409,12 +522,9 @@ class Logit:
                 "Ensure significance level is a float number in range (0, 0.1]")
 
         regressor_pvalues = (self._results.pvalues
-                             .drop('const'))  # Pandas Series
+                             .drop('const'))  # Pandas Series (new object)
 
-        # Find the integer indices of the significant regressors
-        indices_significant = np.where(regressor_pvalues <= alpha)[0]
         # Return the names of significant regressors as a list
-        if indices_significant.size == 0:
-            return []
-        else:
-            return regressor_pvalues.iloc[indices_significant].index.to_list()
+        # (boolean mask over the p-values; empty list if none significant)
+        is_significant = regressor_pvalues.to_numpy() <= alpha
+        return regressor_pvalues.index[is_significant].to_list()
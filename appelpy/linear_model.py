@@ -1,14 +1,58 @@
 import numpy as np
 import pandas as pd
+from scipy.linalg import cho_factor, cho_solve
+from scipy.linalg.lapack import dpocon
+from scipy.linalg.blas import dsyrk
 import statsmodels.api as sm
 from statsmodels.stats.weightstats import DescrStatsW
 import matplotlib.pyplot as plt
 from .diagnostics import (plot_residuals_vs_fitted_values,
                           plot_residuals_vs_predictor_values,
                           pp_plot, qq_plot)
-from .utils import _df_input_conditions
+from .utils import _df_input_conditions, _standardize
 __all__ = ['WLS', 'OLS']
 
+# Below this reciprocal condition number of X'X, OLS is left to the
+# SVD-based pseudoinverse of Statsmodels
+_CHOLESKY_MIN_RCOND = 1e-5
+
+
+def _set_cholesky_pinv(model):
+    """Set the pseudoinverse of the design matrix on a Statsmodels OLS
+    model, computed via a Cholesky factorization of X'X.
+
+    Statsmodels model.fit() re-uses pinv_wexog, normalized_cov_params and
+    rank when they are already set on the model, so this replaces its
+    SVD-based pseudoinverse for designs of full rank.  For full rank,
+    pinv(X) = (X'X)^-1 X'.
+
+    If X'X is not positive definite (e.g. perfect multicollinearity) or is
+    ill-conditioned (e.g. near multicollinearity) then the model is left
+    unchanged and Statsmodels computes the pseudoinverse as usual.  The
+    normal equations square the condition number of X, so the estimates
+    from the Cholesky factor lose accuracy well before X'X is singular.
+    """
+    X = model.wexog
+    # X'X via the BLAS symmetric rank-k update, which only forms the upper
+    # triangle (all that cho_factor reads).  The design matrix built from a
+    # DataFrame is Fortran-ordered, so BLAS reads it without a copy.
+    XtX_upper = dsyrk(1.0, X, trans=1)
+    try:
+        XtX_cho = cho_factor(XtX_upper, check_finite=False)
+    except np.linalg.LinAlgError:
+        return
+    # Reciprocal condition number of X'X (1-norm, LAPACK estimate from the
+    # Cholesky factor), from the full symmetric matrix for its norm
+    XtX = np.triu(XtX_upper)
+    XtX += np.triu(XtX, 1).T
+    rcond, _ = dpocon(XtX_cho[0], np.abs(XtX).sum(axis=0).max())
+    if rcond < _CHOLESKY_MIN_RCOND:
+        return
+    model.normalized_cov_params = cho_solve(XtX_cho, np.eye(X.shape[1]),
+                                            check_finite=False)
+    model.pinv_wexog = model.normalized_cov_params @ X.T
+    model.rank = X.shape[1]
+
 
 class WLS:
     """Weighted Least Squares (WLS) model.
@@ -222,7 +266,11 @@ class WLS:
 
         If the model was not fitted before an attempt to access the attribute,
         then the model will be fitted and the results are returned.
+
+        The summary is only built on first access (and then stored).
         """
+        if self._results_output is None:
+            self._results_output = self._results.summary(alpha=self._alpha)
         return self._results_output
 
     @property
@@ -251,6 +299,8 @@ class WLS:
         is needed.
         Other attributes can also be accessed for exporting the data.
         """
+        if self._results_output_standardized is None:
+            self._results_output_standardized = self._style_std_results()
         return self._results_output_standardized
 
     @property
@@ -310,8 +360,14 @@ class WLS:
         else:
             self._results = model.fit(cov_type=self._cov_type)
 
-        self._results_output = self._results.summary(alpha=self._alpha)
+        self._results_output = None  # summary is made on first access
         self._resid = self._results.resid
+        # Sample range of each regressor and the params (constant first),
+        # used for predictions
+        X_values = self._X.to_numpy(dtype=float)
+        self._X_min = X_values.min(axis=0)
+        self._X_max = X_values.max(axis=0)
+        self._params = self._results.params.to_numpy()
 
         model_selection_dict = {"root_mse": np.sqrt(self._results.mse_resid),
                                 "r_squared": self._results.rsquared,
@@ -368,25 +424,15 @@ class WLS:
             # Output will be labelled as z-scores, not t-values
             std_results_output.rename(columns={'t': 'z', 'P>|t|': 'P>|z|'},
                                       inplace=True)
-        test_dist_name = std_results_output.columns[1]  # store for dict later
-        p_col_name = std_results_output.columns[2]  # store for dict later
         # Gather values from the model that took the standardized data
         std_results_output['coef_stdXy'] = results_obj.params
         std_results_output['coef_stdX'] = results_obj.params * stdev_y
         std_results_output['stdev_X'] = stdev_X
 
-        # Make Pandas Styler object
-        std_results_output = std_results_output\
-            .style.format({'coef': "{:+.4f}",
-                           test_dist_name: '{:+.3f}',
-                           p_col_name: '{:.3f}',
-                           'coef_stdX': '{:+.4f}',
-                           'coef_stdXy': '{:+.4f}',
-                           'stdev_X': '{:.4f}'})
-        std_results_output.set_caption(
-            "Unstandardized and Standardized Estimates")
-        self._results_output_standardized = std_results_output
-        pass
+        # Styler object is only made on first access of
+        # results_output_standardized
+        self._std_results = std_results_output
+        self._results_output_standardized = None
 
     def _get_weighted_stats(self, X, y, weights):
         """Gets the weighted mean and standard deviation for each variable
@@ -404,6 +450,22 @@ class WLS:
 
         return mean_Xw, mean_yw, std_Xw, std_yw
 
+    def _style_std_results(self):
+        """Make the Pandas Styler object for results_output_standardized
+        from the dataframe of standardized estimates."""
+        test_dist_name = self._std_results.columns[1]  # t or z
+        p_col_name = self._std_results.columns[2]  # P>|t| or P>|z|
+        std_results_output = self._std_results\
+            .style.format({'coef': "{:+.4f}",
+                           test_dist_name: '{:+.3f}',
+                           p_col_name: '{:.3f}',
+                           'coef_stdX': '{:+.4f}',
+                           'coef_stdXy': '{:+.4f}',
+                           'stdev_X': '{:.4f}'})
+        std_results_output.set_caption(
+            "Unstandardized and Standardized Estimates")
+        return std_results_output
+
     def predict(self, X_predict, *, within_sample=True):
         """Predict the value(s) of given example(s) based on the fitted model.
 
@@ -414,13 +476,15 @@ class WLS:
 
         Args:
             X_predict (Numpy array): values of the regressors, with shape
-                (# examples, # regressors)
+                (# examples, # regressors).  A 1-D array of shape
+                (# regressors, ) is treated as a single example.
             within_sample (bool, optional): Defaults to True.  If a regressor
                 has a value outside of the data used to fit the data, then
                 NaN value is predicted.
 
         Raises:
             AssertionError: Model needs to be fitted before prediction.
+            TypeError: Pass X_predict as a Numpy array.
             ValueError: Check that X_predict is of shape
                 (# examples, # regressors)
 
@@ -436,6 +500,8 @@ class WLS:
         if type(X_predict) != np.ndarray:
             raise TypeError(
                 "Pass X_predict as Numpy array with shape (# examples, # regressors).")
+        if X_predict.ndim == 1:
+            X_predict = X_predict[np.newaxis, :]  # single example
         examples_to_predict = X_predict.shape[0]
         regressors_detected = X_predict.shape[1]
 
@@ -449,22 +515,22 @@ class WLS:
             # If there is a NaN, then the Numpy comparison still leads
             # to a NaN prediction
             # Truth array `vals_in_range` shape (# examples, # regressors)
-            vals_in_range_min = np.less_equal(np.tile(self._X.min().T, (examples_to_predict, 1)),
-                                              X_predict)
-            vals_in_range_max = np.greater_equal(X_predict,
-                                                 np.tile(self._X.min().T, (examples_to_predict, 1)))
-            vals_in_range = vals_in_range_min & vals_in_range_max
+            # (sample min & max arrays are broadcast across the examples,
+            # and the max check is ANDed into the min check in place)
+            vals_in_range = np.greater_equal(X_predict, self._X_min)
+            np.logical_and(vals_in_range, X_predict <= self._X_max,
+                           out=vals_in_range)
             # Truth array - shape (# examples, )
             # for whether each observation has all X vals in range
-            all_vals_in_range = vals_in_range.all(axis=1)
+            all_vals_in_range = np.all(vals_in_range, axis=-1)
 
-            # Add constant into prediction
-            # Make X_predict have shape (# examples, # regressors + 1)
-            X_predict = np.concatenate([np.ones((examples_to_predict, 1)),
-                                        X_predict], axis=1)
+        # Add constant into prediction (one allocation)
+        # Design matrix has shape (# examples, # regressors + 1)
+        X_design = np.empty((examples_to_predict, regressors_count + 1))
+        X_design[:, 0] = 1
+        X_design[:, 1:] = X_predict
 
-        # Statsmodels predict takes arg w/ shape (# examples, # regressors + 1)
-        preds = self._results.predict(exog=X_predict)
+        preds = X_design @ self._params
         if within_sample:
             preds = np.where(all_vals_in_range, preds, np.NaN)
         return preds
@@ -496,15 +562,12 @@ class WLS:
                 "Ensure significance level is a float number in range (0, 0.1]")
 
         regressor_pvalues = (self._results.pvalues
-                             .drop('const'))  # Pandas Series
+                             .drop('const'))  # Pandas Series (new object)
 
-        # Find the integer indices of the significant regressors
-        indices_significant = np.where(regressor_pvalues <= alpha)[0]
         # Return the names of significant regressors as a list
-        if indices_significant.size == 0:
-            return []
-        else:
-            return regressor_pvalues.iloc[indices_significant].index.to_list()
+        # (boolean mask over the p-values; empty list if none significant)
+        is_significant = regressor_pvalues.to_numpy() <= alpha
+        return regressor_pvalues.index[is_significant].to_list()
 
     def diagnostic_plot(self, plot_name, *, ax=None,
                         predictor=None):
@@ -686,6 +749,7 @@ class OLS(WLS):
         _df_input_conditions(self._X, self._y)
 
         model = sm.OLS(self._y, sm.add_constant(self._X))
+        _set_cholesky_pinv(model)
 
         if printing:
             print("Model fitting in progress...")
@@ -695,8 +759,14 @@ class OLS(WLS):
         else:
             self._results = model.fit(cov_type=self._cov_type)
 
-        self._results_output = self._results.summary(alpha=self._alpha)
+        self._results_output = None  # summary is made on first access
         self._resid = self._results.resid
+        # Sample range of each regressor and the params (constant first),
+        # used for predictions
+        X_values = self._X.to_numpy(dtype=float)
+        self._X_min = X_values.min(axis=0)
+        self._X_max = X_values.max(axis=0)
+        self._params = self._results.params.to_numpy()
 
         model_selection_dict = {"root_mse": np.sqrt(self._results.mse_resid),
                                 "r_squared": self._results.rsquared,
@@ -722,24 +792,36 @@ class OLS(WLS):
         - Fit model on standardized X and y
         - Gather relevant estimates in a Pandas DataFrame & set to attribute
         """
-        # Standardization accounts for NaN values (via Pandas)
-        stdev_X, stdev_y = self._X.std(ddof=1), self._y.std(ddof=1)
-        self._X_standardized = (
-            self._X - self._X.mean()) / stdev_X
-        self._y_standardized = (
-            self._y - self._y.mean()) / stdev_y
+        # Standardization (single pass for the means, ddof=1)
+        X_standardized, stdev_X = _standardize(self._X.to_numpy(dtype=float))
+        y_standardized, stdev_y = _standardize(self._y.to_numpy(dtype=float))
+        self._X_standardized = pd.DataFrame(X_standardized,
+                                            index=self._X.index,
+                                            columns=self._X.columns)
+        self._y_standardized = pd.Series(y_standardized,
+                                         index=self._y.index,
+                                         name=self._y.name)
+        stdev_X = pd.Series(stdev_X, index=self._X.columns)
 
         # Model fitting
         model_standardized = sm.OLS(self._y_standardized,
                                     sm.add_constant(self._X_standardized))
+        _set_cholesky_pinv(model_standardized)
         if self._cov_options:
             results_obj = model_standardized.fit(cov_type=self._cov_type,
                                                  cov_kwds=self._get_cov_kwds())
         else:
             results_obj = model_standardized.fit(cov_type=self._cov_type)
 
-        self._resid_standardized = pd.Series((self._results.get_influence()
-                                              .resid_studentized_internal),
+        # Internally studentized residuals: resid / sqrt(scale * (1 - h)),
+        # with leverage h the diagonal of the hat matrix X pinv(X) (only the
+        # diagonal is formed, as in Statsmodels OLSInfluence).  Using pinv(X)
+        # rather than (X'X)^-1 avoids squaring the condition number of X.
+        leverage = (self._results.model.wexog *
+                    self._results.model.pinv_wexog.T).sum(axis=1)
+        resid_scale = np.sqrt(self._results.mse_resid * (1 - leverage))
+        resid_standardized = self._resid.to_numpy() / resid_scale
+        self._resid_standardized = pd.Series(resid_standardized,
                                              index=self._resid.index,
                                              name='resid_standardized')
 
@@ -759,25 +841,15 @@ class OLS(WLS):
             # Output will be labelled as z-scores, not t-values
             std_results_output.rename(columns={'t': 'z', 'P>|t|': 'P>|z|'},
                                       inplace=True)
-        test_dist_name = std_results_output.columns[1]  # store for dict later
-        p_col_name = std_results_output.columns[2]  # store for dict later
         # Gather values from the model that took the standardized data
         std_results_output['coef_stdXy'] = results_obj.params
         std_results_output['coef_stdX'] = results_obj.params * stdev_y
         std_results_output['stdev_X'] = stdev_X
 
-        # Make Pandas Styler object
-        std_results_output = std_results_output\
-            .style.format({'coef': "{:+.4f}",
-                           test_dist_name: '{:+.3f}',
-                           p_col_name: '{:.3f}',
-                           'coef_stdX': '{:+.4f}',
-                           'coef_stdXy': '{:+.4f}',
-                           'stdev_X': '{:.4f}'})
-        std_results_output.set_caption(
-            "Unstandardized and Standardized Estimates")
-        self._results_output_standardized = std_results_output
-        pass
+        # Styler object is only made on first access of
+        # results_output_standardized
+        self._std_results = std_results_output
+        self._results_output_standardized = None
 
     def _get_cov_kwds(self):
         # Appelpy cov_options -> Statsmodels cov_kwds
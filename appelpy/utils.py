@@ -1,5 +1,3 @@
-import sys
-import os
 import pandas as pd
 import numpy as np
 import itertools
@@ -7,23 +5,40 @@ __all__ = ['DummyEncoder', 'InteractionEncoder',
            'get_dataframe_columns_diff']
 
 
-class _SuppressPrints:
-    """For internal use to suppress print output from Statsmodels that
-    is not wanted in Appelpy.
+def _standardize(values):
+    """Standardize a float array (each column if 2-D), with ddof=1.
+
+    The mean is computed once and the centered values are re-used for the
+    standard deviation, so the data are only traversed once for each.
+
+    Returns:
+        tuple: the standardized array and the standard deviation(s).
     """
+    centered = values - values.mean(axis=0)
+    stdev = np.sqrt((centered ** 2).sum(axis=0) / (len(centered) - 1))
+    return centered / stdev, stdev
 
-    def __enter__(self):
-        self._original_stdout = sys.stdout
-        sys.stdout = open(os.devnull, 'w')
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        sys.stdout.close()
-        sys.stdout = self._original_stdout
+def _get_dummies(series, prefix, prefix_sep='_'):
+    """Encode a Series into uint8 dummy columns - one per category.
+
+    The columns match those of pd.get_dummies: every category (in order)
+    of a categorical Series, otherwise the sorted unique non-NaN values.
+    A row with a NaN value is a row of zeros.
+    """
+    if pd.api.types.is_categorical_dtype(series.dtype):
+        codes, levels = series.cat.codes.to_numpy(), series.cat.categories
+    else:
+        codes, levels = pd.factorize(series, sort=True)  # NaN code is -1
+    dummies = (codes[:, np.newaxis] == np.arange(len(levels))).view(np.uint8)
+    return pd.DataFrame(dummies, index=series.index,
+                        columns=[''.join([prefix, prefix_sep, str(level)])
+                                 for level in levels])
 
 
 def _df_input_conditions(X, y):
     if (y.isin([np.inf, -np.inf]).any() or
-            len(X[X.isin([np.inf, -np.inf]).any(1)]) > 0):
+            X.isin([np.inf, -np.inf]).values.any()):
         raise ValueError(
             '''Remove infinite (positive or negative) values from the
             dataset before modelling.''')
@@ -169,27 +184,27 @@ class DummyEncoder:
 
             # GENERATE DUMMIES GIVEN THE nan_policy
             if self._nan_policy == 'row_of_zero':  # Pandas default behaviour
-                dummy_cols = pd.get_dummies(
-                    self._df[col], prefix=col, prefix_sep=self._separator)
+                dummy_cols = _get_dummies(self._df[col], col,
+                                          self._separator)
             if self._nan_policy == 'dummy_for_nan':
                 # If there are no NaN category values then do not create
                 # a NaN dummy:
                 if np.count_nonzero((~pd.isna(self._df[col].to_numpy()))
                                     == len(self._df[col].to_numpy())):
-                    dummy_cols = pd.get_dummies(
-                        self._df[col], prefix=col, prefix_sep=self._separator)
+                    dummy_cols = _get_dummies(self._df[col], col,
+                                              self._separator)
                 else:
                     # Note: pd.get_dummies(... dummy_na=True) is not robust
                     # for nullable Int Series
-                    dummy_cols = pd.get_dummies(
-                        self._df[col], prefix=col, prefix_sep=self._separator)
+                    dummy_cols = _get_dummies(self._df[col], col,
+                                              self._separator)
                     # Create NaN dummy given values of the other dummies:
                     nan_dummy_col_str = ''.join([col, self._separator, 'nan'])
                     dummy_cols[nan_dummy_col_str] = np.where(
                         dummy_cols.sum(axis='columns') == 0, 1, 0)
             if self._nan_policy == 'row_of_nan':
-                dummy_cols = pd.get_dummies(self._df[col], prefix=col,
-                                            prefix_sep=self._separator)
+                dummy_cols = _get_dummies(self._df[col], col,
+                                          self._separator)
                 # Replace the zero vals with NaN:
                 if self._df[col].isna().any():
                     nan_row_indices = list(dummy_cols[((dummy_cols == 0)
@@ -303,14 +318,14 @@ class InteractionEncoder:
                     # Use original
                     col_dummies = pd.Series(self._df[col_name], name=col_name)
                 if col_dtype == 'category':
-                    col_dummies = pd.get_dummies(
-                        self._df[col_name], prefix=str(col_name))
+                    col_dummies = _get_dummies(self._df[col_name],
+                                               str(col_name))
                 if col_other_bool:
                     col_other_dummies = pd.Series(self._df[col_other],
                                                   name=col_other)
                 if col_other_dtype == 'category':
-                    col_other_dummies = pd.get_dummies(self._df[col_other],
-                                                       prefix=str(col_other))
+                    col_other_dummies = _get_dummies(self._df[col_other],
+                                                     str(col_other))
 
                 # CASES FOR INTERACTION TERM ENCODING:
                 # 1) both cols are Boolean
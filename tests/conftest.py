@@ -0,0 +1,29 @@
+import pathlib
+import pickle
+import pytest
+import statsmodels.datasets
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _cache_rdatasets(request):
+    # Keep each downloaded R dataset in the pytest cache directory, so that
+    # later test runs unpickle it instead of fetching & parsing the CSV.
+    # Run pytest with --cache-clear to fetch the datasets again.
+    pytest_cache = getattr(request.config, 'cache', None)
+    if pytest_cache is None:  # e.g. run with -p no:cacheprovider
+        yield
+        return
+    cache_dir = pathlib.Path(str(pytest_cache.makedir('rdatasets')))
+    get_rdataset = statsmodels.datasets.get_rdataset
+
+    def get_rdataset_cached(dataname, package='datasets', cache=False):
+        cache_file = cache_dir / f"{package}_{dataname}.pkl"
+        if cache_file.exists():
+            return pickle.loads(cache_file.read_bytes())
+        dataset = get_rdataset(dataname, package, cache)
+        cache_file.write_bytes(pickle.dumps(dataset))
+        return dataset
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(statsmodels.datasets, 'get_rdataset', get_rdataset_cached)
+        yield
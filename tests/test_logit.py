@@ -6,6 +6,7 @@ import numpy as np
 from pandas.util.testing import (assert_series_equal,
                                  assert_frame_equal,
                                  assert_numpy_array_equal)
+from appelpy import discrete_model
 from appelpy.discrete_model import Logit
 from appelpy.utils import DummyEncoder
 
@@ -32,9 +33,8 @@ def model_birthwt():
                   .astype('category'))
 
     dummy_enc = DummyEncoder(df, {'race': 'white'})
-    df = dummy_enc.transform()
-    for col in ['race_black', 'race_other']:
-        df[col] = df[col].astype(int)
+    df = dummy_enc.transform().astype({'race_black': 'int8',
+                                       'race_other': 'int8'})
 
     # Model test case
     X_list = ['smoke', 'race_black', 'race_other']
@@ -210,6 +210,10 @@ def test_predictions(model_mtcars_vs, model_mtcars_am):
     assert_numpy_array_equal(np.round(actual_pred, 7),
                              expected_pred)
 
+    # Regressor value above the sample max (wt)
+    actual_pred = model_mtcars_vs.predict(np.array([[1000000, 180]]))
+    assert np.isnan(actual_pred).all()
+
     expected_pred = np.array([0.1194021, 0.3862832, 0.7450109])
     actual_pred = model_mtcars_am.predict(
         np.array(([[15], [20], [25]])))
@@ -225,3 +229,50 @@ def test_predictions(model_mtcars_vs, model_mtcars_am):
         model_mtcars_am.predict(
             np.array(([15, 20, 25],
                       [1, 2, 3])))
+
+
+
+@pytest.fixture(scope='module')
+def df_spector():
+    # Bundled with Statsmodels (no download needed)
+    return sm.datasets.spector.load_pandas().data
+
+
+def _sm_logit_spector(df):
+    return sm.Logit(df['GRADE'],
+                    sm.add_constant(df[['GPA', 'TUCE', 'PSI']])).fit(disp=0)
+
+
+def test_irls_matches_statsmodels(df_spector):
+    model = Logit(df_spector, ['GRADE'], ['GPA', 'TUCE', 'PSI']).fit()
+    expected = _sm_logit_spector(df_spector)
+
+    assert model.results.mle_settings['optimizer'] == 'irls'
+    np.testing.assert_allclose(model.results.params.to_numpy(),
+                               expected.params.to_numpy(), rtol=1e-8)
+    np.testing.assert_allclose(model.results.bse.to_numpy(),
+                               expected.bse.to_numpy(), rtol=1e-6)
+    np.testing.assert_allclose(model.results.llf, expected.llf, rtol=1e-10)
+
+    retvals = model.results.mle_retvals
+    assert retvals.keys() == expected.mle_retvals.keys()
+    assert retvals['converged'] and retvals['warnflag'] == 0
+    np.testing.assert_allclose(retvals['fopt'],
+                               expected.mle_retvals['fopt'], rtol=1e-10)
+    np.testing.assert_allclose(retvals['Hessian'],
+                               expected.mle_retvals['Hessian'], rtol=1e-6)
+    np.testing.assert_allclose(retvals['score'], 0, atol=1e-10)
+
+
+def test_irls_fallback(df_spector, monkeypatch):
+    # e.g. X'WX is not positive definite: Statsmodels fits the model instead
+    def singular_step(*args):
+        raise np.linalg.LinAlgError("Matrix is not positive definite")
+    monkeypatch.setattr(discrete_model, '_logit_irls_step', singular_step)
+
+    model = Logit(df_spector, ['GRADE'], ['GPA', 'TUCE', 'PSI']).fit()
+    expected = _sm_logit_spector(df_spector)
+
+    assert model.results.mle_settings['optimizer'] == 'newton'
+    assert_series_equal(model.results.params, expected.params)
+    assert_series_equal(model.results.bse, expected.bse)
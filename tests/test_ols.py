@@ -1,39 +1,88 @@
+import functools
+import re
 import pytest
 import pandas as pd
 import numpy as np
 import statsmodels
 import statsmodels.api as sm
-from pandas.util.testing import (assert_series_equal,
-                                 assert_frame_equal,
-                                 assert_numpy_array_equal)
+from pandas.testing import assert_series_equal, assert_frame_equal
+from numpy.testing import assert_array_equal
 from appelpy.utils import DummyEncoder
 from appelpy.linear_model import OLS
 
+# Characters to replace with '_' in column names
+_COL_CLEAN_PATTERN = re.compile(r"[ ,.\-]")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_rdataset(dataname, package='datasets'):
+    # Each R dataset is only loaded once per test session
+    return sm.datasets.get_rdataset(dataname, package).data
+
+
+def _rdata(dataname, package='datasets'):
+    # Copy so that pre-processing in one test does not leak into others
+    return _get_rdataset(dataname, package).copy()
+
+
+# - EXPECTED VALUES (mtcars model) -
+# Read-only so that one test cannot mutate the values seen by another
+
+_EXPECTED_RESID_STD = np.array(
+    [-0.62542, -0.49419, -1.48858, 0.22975, 0.72174, -1.17901,
+     -0.33191, 1.17731, -1.23866, 0.2607, -0.63558, 0.58422,
+     0.29971, -0.70185, -0.32268, 0.08537, 2.15973, 2.00067,
+     0.636, 1.82147, -1.33149, -0.43212, -0.92224, -0.0748,
+     1.5755, -0.36299, 0.5794, 1.35596, -0.94227, -0.43467,
+     -0.66451, -1.333],
+    dtype=np.float64)
+_EXPECTED_RESID_STD.setflags(write=False)
+
+_EXPECTED_Y_STD = np.array(
+    [0.15088, 0.15088, 0.44954, 0.21725, -0.23073, -0.33029,
+     -0.96079, 0.71502, 0.44954, -0.14777, -0.38006, -0.61235,
+     -0.46302, -0.81146, -1.60788, -1.60788, -0.89442, 2.04239,
+     1.71055, 2.29127, 0.23385, -0.76168, -0.81146, -1.12671,
+     -0.14777, 1.19619, 0.98049, 1.71055, -0.71191, -0.06481,
+     -0.84464, 0.21725],
+    dtype=np.float64)
+_EXPECTED_Y_STD.setflags(write=False)
+
+_EXPECTED_QSEC_STD = np.array(
+    [-0.77717, -0.46378, 0.42601, 0.89049, -0.46378, 1.32699,
+     -1.12413, 1.20387, 2.82675, 0.25253, 0.5883, -0.25113,
+     -0.1392, 0.08464, 0.07345, -0.01609, -0.23993, 0.90728,
+     0.37564, 1.14791, 1.20947, -0.54772, -0.30709, -1.36476,
+     -0.44699, 0.5883, -0.64286, -0.53093, -1.87401, -1.3144,
+     -1.81805, 0.42041],
+    dtype=np.float64)
+_EXPECTED_QSEC_STD.setflags(write=False)
+
 
 # - MODELS -
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def model_mtcars_final():
-    df = sm.datasets.get_rdataset('mtcars').data
+    df = _rdata('mtcars')
     X_list = ['wt', 'qsec', 'am']
     model = OLS(df, ['mpg'], X_list).fit()
     return model
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def model_cars():
-    df = sm.datasets.get_rdataset('cars').data
+    df = _rdata('cars')
     X_list = ['speed']
     model = OLS(df, ['dist'], X_list).fit()
     return model
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def model_cars93():
     # Load data and pre-processing
-    df = sm.datasets.get_rdataset('Cars93', 'MASS').data
+    df = _rdata('Cars93', 'MASS')
     df.columns = (df.columns
-                  .str.replace(r"[ ,.,-]", '_')
+                  .str.replace(_COL_CLEAN_PATTERN, '_', regex=True)
                   .str.lower())
     # Dummy columns
     base_levels = {'type': 'Compact',
@@ -42,7 +91,7 @@ def model_cars93():
     dummy_encoder = DummyEncoder(df, base_levels, separator='_')
     df = dummy_encoder.transform()
     df.columns = (df.columns
-                  .str.replace(r"[ ,.,-]", '_')
+                  .str.replace(_COL_CLEAN_PATTERN, '_', regex=True)
                   .str.lower())
     # Model
     X_list = ['type_large', 'type_midsize', 'type_small',
@@ -54,12 +103,13 @@ def model_cars93():
     return model
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def model_caschools():
-    df = sm.datasets.get_rdataset('Caschool', 'Ecdat').data
+    df = _rdata('Caschool', 'Ecdat')
 
     # Square income
-    df['avginc_sq'] = df['avginc'] ** 2
+    avginc = df['avginc'].to_numpy()
+    df['avginc_sq'] = avginc * avginc
 
     # Model
     X_list = ['avginc', 'avginc_sq']
@@ -69,7 +119,7 @@ def model_caschools():
 
 @pytest.mark.remote_data
 def test_model_not_fitted():
-    df = sm.datasets.get_rdataset('cars').data
+    df = _rdata('cars')
     X_list = ['speed']
     model = OLS(df, ['dist'], X_list)
 
@@ -82,7 +132,7 @@ def test_model_not_fitted():
 
 @pytest.mark.remote_data
 def test_prints(capsys):
-    df = sm.datasets.get_rdataset('cars').data
+    df = _rdata('cars')
     X_list = ['speed']
 
     OLS(df, ['dist'], X_list).fit(printing=True)
@@ -100,8 +150,9 @@ def test_coefficients(model_mtcars_final):
                                'wt': -3.9165,
                                'qsec': 1.2259,
                                'am': 2.9358})
-    assert_series_equal(model_mtcars_final.results.params.round(4),
-                        expected_coef)
+    assert model_mtcars_final.results.params.index.equals(expected_coef.index)
+    np.testing.assert_allclose(model_mtcars_final.results.params.to_numpy(),
+                               expected_coef.to_numpy(), atol=5e-5, rtol=0)
 
     assert isinstance(model_mtcars_final.results_output,
                       statsmodels.iolib.summary.Summary)
@@ -175,39 +226,37 @@ def test_model_selection_stats(model_mtcars_final):
 
 
 @pytest.mark.remote_data
-def test_significant_regressors(model_mtcars_final):
-    expected_regressors_000001 = []
-    expected_regressors_001 = ['wt', 'qsec']  # 0.1% sig
-    expected_regressors_01 = ['wt', 'qsec']  # 1% sig
-    expected_regressors_05 = ['wt', 'qsec', 'am']  # 5% sig
-
-    assert (model_mtcars_final.significant_regressors(0.000001)
-            == expected_regressors_000001)
-    assert (model_mtcars_final.significant_regressors(0.001)
-            == expected_regressors_001)
-    assert (model_mtcars_final.significant_regressors(0.01)
-            == expected_regressors_01)
-    assert (model_mtcars_final.significant_regressors(0.05)
-            == expected_regressors_05)
+@pytest.mark.parametrize('alpha, expected_regressors', [
+    (0.000001, []),
+    (0.001, ['wt', 'qsec']),  # 0.1% sig
+    (0.01, ['wt', 'qsec']),  # 1% sig
+    (0.05, ['wt', 'qsec', 'am']),  # 5% sig
+])
+def test_significant_regressors_positive(model_mtcars_final, alpha,
+                                         expected_regressors):
+    assert (model_mtcars_final.significant_regressors(alpha)
+            == expected_regressors)
 
-    with pytest.raises(TypeError):
-        model_mtcars_final.significant_regressors('str')
 
-    with pytest.raises(ValueError):
-        model_mtcars_final.significant_regressors(np.inf)
-    with pytest.raises(TypeError):
-        model_mtcars_final.significant_regressors(0)
-    with pytest.raises(TypeError):
-        model_mtcars_final.significant_regressors(-1)
-    with pytest.raises(ValueError):
-        model_mtcars_final.significant_regressors(0.11)
+@pytest.mark.remote_data
+@pytest.mark.parametrize('alpha, expected_error', [
+    ('str', TypeError),
+    (np.inf, ValueError),
+    (0, TypeError),
+    (-1, TypeError),
+    (0.11, ValueError),
+])
+def test_significant_regressors_invalid(model_mtcars_final, alpha,
+                                        expected_error):
+    with pytest.raises(expected_error):
+        model_mtcars_final.significant_regressors(alpha)
 
 
 @pytest.mark.remote_data
 def test_other_attributes(model_mtcars_final):
     # Weights
     expected_w = np.ones(32)
-    assert_numpy_array_equal(model_mtcars_final.w.to_numpy(), expected_w)
+    assert_array_equal(model_mtcars_final.w.to_numpy(), expected_w)
     assert isinstance(model_mtcars_final.w, pd.Series)
 
     # X and y
@@ -215,58 +264,43 @@ def test_other_attributes(model_mtcars_final):
     assert isinstance(model_mtcars_final.y, pd.Series)
 
     # Residuals
-    expected_resid_standardized = (
-        np.array([-0.62542, -0.49419, -1.48858,  0.22975,  0.72174, -1.17901,
-                  -0.33191,  1.17731, -1.23866,  0.2607, -0.63558,  0.58422,
-                  0.29971, -0.70185, -0.32268,  0.08537,  2.15973,  2.00067,
-                  0.636,  1.82147, -1.33149, -0.43212, -0.92224, -0.0748,
-                  1.5755, -0.36299,  0.5794,  1.35596, -0.94227, -0.43467,
-                  -0.66451, -1.333])
-    )
-    assert_numpy_array_equal(np.round(model_mtcars_final
-                                      .resid_standardized.to_numpy(), 5),
-                             expected_resid_standardized)
+    np.testing.assert_allclose(
+        model_mtcars_final.resid_standardized.to_numpy(),
+        _EXPECTED_RESID_STD, atol=5e-6, rtol=0)
 
     # y_standardized
-    expected_y_standardized = (
-        np.array([0.15088,  0.15088,  0.44954,  0.21725, -0.23073, -0.33029,
-                  -0.96079,  0.71502,  0.44954, -0.14777, -0.38006, -0.61235,
-                  -0.46302, -0.81146, -1.60788, -1.60788, -0.89442,  2.04239,
-                  1.71055,  2.29127,  0.23385, -0.76168, -0.81146, -1.12671,
-                  -0.14777,  1.19619,  0.98049,  1.71055, -0.71191, -0.06481,
-                  -0.84464,  0.21725])
-    )
-    assert_numpy_array_equal(np.round(model_mtcars_final.y_standardized
-                                      .to_numpy(), 5),
-                             expected_y_standardized)
+    np.testing.assert_allclose(
+        model_mtcars_final.y_standardized.to_numpy(),
+        _EXPECTED_Y_STD, atol=5e-6, rtol=0)
 
     # X_standardized col
-    expected_qsec_standardized = (
-        np.array([-0.77717, -0.46378,  0.42601,  0.89049, -0.46378,  1.32699,
-                  -1.12413,  1.20387,  2.82675,  0.25253,  0.5883, -0.25113,
-                  -0.1392,  0.08464,  0.07345, -0.01609, -0.23993,  0.90728,
-                  0.37564,  1.14791,  1.20947, -0.54772, -0.30709, -1.36476,
-                  -0.44699,  0.5883, -0.64286, -0.53093, -1.87401, -1.3144,
-                  -1.81805,  0.42041])
-    )
-    assert_numpy_array_equal(np.round(model_mtcars_final.X_standardized['qsec']
-                                      .to_numpy(), 5),
-                             expected_qsec_standardized)
+    np.testing.assert_allclose(
+        model_mtcars_final.X_standardized['qsec'].to_numpy(),
+        _EXPECTED_QSEC_STD, atol=5e-6, rtol=0)
 
 
 @pytest.mark.remote_data
 def test_predictions(model_caschools):
+    # One batch of examples: avginc of 10, 11, 40 & 41 (with squares)
+    X_predict = np.array([[10, 10 ** 2], [11, 11 ** 2],
+                          [40, 40 ** 2], [41, 41 ** 2]], dtype=np.float64)
+    y_hat = model_caschools.predict(X_predict)
+    assert y_hat.shape == (4,)
+
     # Est effect of avg 10 -> 11:
     expected_y_hat_diff = 2.9625
-    actual_y_hat_diff = (model_caschools.predict(np.array([[11, 11 ** 2]])) -
-                         model_caschools.predict(np.array([[10, 10 ** 2]])))[0]
-    assert np.round(actual_y_hat_diff, 4) == expected_y_hat_diff
+    assert np.round(y_hat[1] - y_hat[0], 4) == expected_y_hat_diff
 
     # Est effect of avg 40 -> 41:
     expected_y_hat_diff = 0.4240
-    actual_y_hat_diff = (model_caschools.predict(np.array([[41, 41 ** 2]])) -
-                         model_caschools.predict(np.array([[40, 40 ** 2]])))[0]
-    assert np.round(actual_y_hat_diff, 4) == expected_y_hat_diff
+    assert np.round(y_hat[3] - y_hat[2], 4) == expected_y_hat_diff
+
+    # A 1-D array is a single example
+    np.testing.assert_allclose(
+        model_caschools.predict(np.array([11.0, 121.0])), y_hat[[1]])
+
+    # Regressor values above the sample max give NaN when within_sample
+    assert np.isnan(model_caschools.predict(np.array([[100, 100 ** 2]]))).all()
 
     with pytest.raises(TypeError):
         model_caschools.predict(pd.Series([41]))
@@ -277,7 +311,7 @@ def test_predictions(model_caschools):
 @pytest.mark.remote_data
 def test_clustered_standard_errors():
     # Pooled OLS - Fatality dataset
-    df = sm.datasets.get_rdataset('Fatality', 'Ecdat').data
+    df = _rdata('Fatality', 'Ecdat')
 
     y_list, X_list = ['mrall'], ['beertax']
     model = OLS(df, y_list, X_list,
@@ -297,7 +331,7 @@ def test_clustered_standard_errors():
 
 @pytest.mark.remote_data
 def test_driscoll_kraay_standard_errors():
-    df = sm.datasets.get_rdataset('PetersenCL', 'sandwich').data
+    df = _rdata('PetersenCL', 'sandwich')
 
     # Compare examples from R docs for vcovPL function (sandwich package)
     # (T-1 lags = 9, no correction):
@@ -332,3 +366,51 @@ def test_driscoll_kraay_standard_errors():
                                'x': 0.02816896})
     assert_series_equal(model_3.results.bse.round(4),
                         expected_3_se.round(4))
+
+
+def _near_collinear_df(eps):
+    # Regressor x2 is x1 plus noise of scale eps
+    rng = np.random.default_rng(0)
+    x1 = rng.normal(size=500)
+    x2 = x1 + eps * rng.normal(size=500)
+    y = 3 + x1 + 2 * x2 + rng.normal(scale=0.01, size=500)
+    return pd.DataFrame({'y': y, 'x1': x1, 'x2': x2})
+
+
+@pytest.mark.parametrize('eps', [1e-2, 5e-3, 1e-4, 1e-6, 1e-7])
+def test_near_collinear_regressors(eps):
+    # x2 is nearly a copy of x1: X'X is full rank but ill-conditioned, so
+    # the estimates must still match least squares on X itself.  The
+    # reciprocal condition number of X'X is just above the Cholesky cutoff
+    # for eps=1e-2 (~2e-5) and just below it for eps=5e-3 (~5e-6)
+    df = _near_collinear_df(eps)
+    model = OLS(df, ['y'], ['x1', 'x2']).fit()
+
+    X = sm.add_constant(df[['x1', 'x2']]).to_numpy()
+    expected_coef, expected_ssr = np.linalg.lstsq(X, df['y'].to_numpy(),
+                                                  rcond=None)[:2]
+    np.testing.assert_allclose(model.results.params.to_numpy(),
+                               expected_coef, rtol=1e-9)
+    np.testing.assert_allclose(model.results.ssr, expected_ssr[0],
+                               rtol=1e-9)
+
+
+def test_longley():
+    # Classic ill-conditioned regression (bundled with Statsmodels)
+    data = sm.datasets.longley.load_pandas()
+    df = pd.concat([data.endog, data.exog], axis='columns')
+    model = OLS(df, [data.endog.name], list(data.exog.columns)).fit()
+
+    expected_coef = sm.OLS(data.endog, sm.add_constant(data.exog)).fit().params
+    np.testing.assert_allclose(model.results.params.to_numpy(),
+                               expected_coef.to_numpy(), rtol=1e-9)
+
+
+@pytest.mark.parametrize('eps', [1e-2, 1e-7])
+def test_resid_standardized_near_collinear(eps):
+    # Leverage must not square the condition number of X: compare against
+    # the studentized residuals of Statsmodels OLSInfluence
+    model = OLS(_near_collinear_df(eps), ['y'], ['x1', 'x2']).fit()
+    expected = model.results.get_influence().resid_studentized_internal
+    np.testing.assert_allclose(model.resid_standardized.to_numpy(),
+                               expected, rtol=1e-10)
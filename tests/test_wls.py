@@ -39,7 +39,8 @@ def model_caschools():
     df = sm.datasets.get_rdataset('Caschool', 'Ecdat').data
 
     # Square income
-    df['avginc_sq'] = df['avginc'] ** 2
+    avginc = df['avginc'].to_numpy()
+    df['avginc_sq'] = avginc * avginc
 
     # Model: WLS with no weights - equivalent to OLS
     X_list = ['avginc', 'avginc_sq']
@@ -52,7 +53,8 @@ def test_prints(capsys):
     df = sm.datasets.get_rdataset('Caschool', 'Ecdat').data
 
     # Square income
-    df['avginc_sq'] = df['avginc'] ** 2
+    avginc = df['avginc'].to_numpy()
+    df['avginc_sq'] = avginc * avginc
 
     # Model: WLS with no weights - equivalent to OLS
     X_list = ['avginc', 'avginc_sq']